@@ -1,27 +1,126 @@
-from decimal import Decimal, getcontext
+from decimal import (
+    MAX_EMAX,
+    MAX_PREC,
+    MIN_EMIN,
+    Context,
+    Decimal,
+    InvalidOperation,
+    Overflow,
+)
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from ._validators import Validators
-from .exceptions import DifferentCurrencyError
+from .exceptions import DifferentCurrencyError, InvalidOperationError
 from .types import Currency, OperationType
 
 if TYPE_CHECKING:
+    from typing_extensions import Self
+
     from ._dinero import Dinero
 
 validate = Validators()
 
+# amounts can have at most this many integer digits, the default decimal
+# context precision; fixed so validation does not depend on the caller context
+_MAX_DIGITS = 28
+_MAX_INT = 10**_MAX_DIGITS
+
+# scaling between major and minor units only moves the exponent, so it is done
+# in a context that never rounds, whatever the caller's context precision is
+_EXACT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+
+@lru_cache(maxsize=32)
+def _format_spec(exponent: int) -> str:
+    """Return the format spec for an amount with ``exponent`` decimal places."""
+    return f",.{exponent}f"
+
+
+def _to_decimal(amount: OperationType) -> Decimal:
+    """
+    Return ``amount`` as a finite Decimal, only going through ``str`` for floats.
+
+    Raises:
+        InvalidOperationError: The amount is not a valid finite number.
+    """
+    try:
+        if isinstance(amount, Decimal):
+            decimal_amount = amount
+        elif isinstance(amount, float):
+            decimal_amount = Decimal(str(amount))
+        else:
+            decimal_amount = Decimal(amount)
+
+    except (ValueError, InvalidOperation, Overflow):
+        raise InvalidOperationError(InvalidOperationError.operation_msg)
+
+    if not decimal_amount.is_finite():
+        raise InvalidOperationError(InvalidOperationError.operation_msg)
+
+    return decimal_amount
+
 
 class Base:
     """The base Dinero class with the constructor, properties and utils."""
 
+    __slots__ = ("_amount", "_currency", "_code", "_exponent", "_minor")
+
     def __init__(self, amount: int | float | str | Decimal, currency: Currency):
-        from ._dinero import Dinero
+        if isinstance(amount, int):
+            if not -_MAX_INT < amount < _MAX_INT:
+                raise InvalidOperationError(InvalidOperationError.operation_msg)
 
-        self.amount = amount
-        self.currency = currency
-        self.dinero = Dinero
+            # whole numbers within the limit scale to minor units exactly
+            minor = amount * 10 ** currency["exponent"]
+            self._set_amount(Decimal(amount), currency, minor)
+            return
 
         validate.dinero_amount(amount)
+        self._set_amount(_to_decimal(amount), currency)
+
+    @classmethod
+    def _from_decimal(cls, amount: Decimal, currency: Currency) -> "Self":
+        """
+        Return a new object from an already computed Decimal, skipping the
+        validation and coercion done by the constructor.
+
+        Args:
+            amount (Decimal): trusted amount, e.g. the result of an operation.
+            currency (dict): Expressed as an ISO 4217 currency code.
+
+        Returns:
+            DINERO: Dinero object.
+        """
+        obj = cls.__new__(cls)
+        obj._set_amount(amount, currency)
+        return obj
+
+    def _set_amount(
+        self, amount: Decimal, currency: Currency, minor: int | None = None
+    ) -> None:
+        """
+        Set the amount and currency, caching the currency fields read by every
+        operation, format and comparison.
+
+        Args:
+            amount (Decimal): amount in major units.
+            currency (dict): Expressed as an ISO 4217 currency code.
+            minor (int, optional): amount in minor units, if already known.
+        """
+        self._amount = amount
+        self._currency = currency
+        self._code = currency.get("code")
+        self._exponent = currency["exponent"]
+        self._minor = self._to_minor(amount) if minor is None else minor
+
+    @property
+    def amount(self) -> Decimal:
+        return self._amount
+
+    @property
+    def currency(self) -> Currency:
+        return self._currency
 
     @property
     def symbol(self):
@@ -29,11 +128,11 @@ class Base:
 
     @property
     def code(self):
-        return self.currency.get("code")
+        return self._code
 
     @property
     def exponent(self):
-        return self.currency.get("exponent")
+        return self._exponent
 
     @property
     def precision(self):
@@ -41,34 +140,61 @@ class Base:
 
     @property
     def _formatted_amount(self) -> str:
-        currency_format = f",.{self.exponent}f"
-        return f"{self._normalize(quantize=True):{currency_format}}"
+        return format(self._normalize(quantize=True), _format_spec(self._exponent))
 
     @property
     def raw_amount(self) -> Decimal:
         return self._normalize(quantize=True)
 
-    def _get_instance(self, amount: "OperationType | Dinero") -> "Dinero":
+    def _to_minor(self, amount: Decimal) -> int:
         """
-        Return a Dinero object after checking the currency codes are equal and
-        transforming it to Dinero if needed.
+        Return the amount expressed as an integer number of minor units.
 
         Args:
-            amount (str, int, float, Decimal, Dinero): amount to be instantiated
+            amount (Decimal): amount in major units.
 
         Returns:
-            DINERO: Dinero object.
+            INT: amount rounded (half even) to the currency minor unit.
+
+        Raises:
+            InvalidOperationError: The amount has more than ``_MAX_DIGITS``
+                integer digits, e.g. "1e999999", whose minor units would be a
+                huge integer.
+        """
+        if amount and amount.adjusted() >= _MAX_DIGITS:
+            raise InvalidOperationError(InvalidOperationError.operation_msg)
+
+        return round(amount.scaleb(self._exponent, _EXACT))
+
+    def _check_same_currency(self, other: "Base") -> None:
         """
-        amount_obj = (
-            amount
-            if isinstance(amount, self.dinero)
-            else self.dinero(amount, self.currency)
-        )
+        Check that both Dinero objects share the same currency code.
 
-        if amount_obj.code != self.code:
+        Args:
+            other (Dinero): object to compare the currency with.
+
+        Raises:
+            DifferentCurrencyError: Different currencies where used.
+        """
+        if other._code != self._code:
             raise DifferentCurrencyError("Currencies can not be different")
 
-        return amount_obj
+    def _get_operand(self, amount: "OperationType | Dinero") -> Decimal:
+        """
+        Return the Decimal value of an operand, checking the currency codes are
+        equal for Dinero objects and validating raw amounts otherwise.
+
+        Args:
+            amount (str, int, float, Decimal, Dinero): operand to be converted.
+
+        Returns:
+            DECIMAL: Decimal object.
+        """
+        if isinstance(amount, Base):
+            self._check_same_currency(amount)
+            return amount._normalize()
+
+        return _to_decimal(amount)
 
     def _normalize(self, quantize: bool = False) -> Decimal:
         """
@@ -81,11 +207,7 @@ class Base:
             DECIMAL: Decimal object.
         """
 
-        getcontext().prec = self.precision
-        normalized_amount = Decimal(self.amount).normalize()
-
         if quantize:
-            places = Decimal(f"1e-{self.exponent}")
-            normalized_amount = normalized_amount.quantize(places)
+            return Decimal(self._minor).scaleb(-self._exponent, _EXACT)
 
-        return normalized_amount
+        return self._amount
@@ -21,7 +21,6 @@ from decimal import Decimal
 from typing import Any
 
 from ._operations import Operations
-from ._utils import DecimalEncoder
 from ._validators import Validators
 from .types import Currency, OperationType
 
@@ -39,6 +38,8 @@ class Dinero(Operations):
         currency (dict): Expressed as an ISO 4217 currency code.
     """
 
+    __slots__ = ("_str_cache",)
+
     def __init__(self, amount: int | float | str | Decimal, currency: Currency):
         super().__init__(amount, currency)
 
@@ -362,14 +363,8 @@ class Dinero(Operations):
             DICT: The object's data as a Python Dictionary.
         """
 
-        normalized_amount = self._normalize(quantize=True)
-        amount = self._formatted_amount if amount_with_format else str(normalized_amount)
-
-        dict_repr = self.__dict__
-        dict_repr["amount"] = amount
-        dict_repr["currency"].setdefault("symbol", "$")
-        del dict_repr["dinero"]
-        return dict_repr
+        amount = self._formatted_amount if amount_with_format else str(self.raw_amount)
+        return {"amount": amount, "currency": {**self.currency, "symbol": self.symbol}}
 
     def to_json(self, amount_with_format: bool = False) -> str:
         """
@@ -393,8 +388,7 @@ class Dinero(Operations):
             STR: The object's data as JSON.
         """
 
-        dict_representation = self.to_dict(amount_with_format)
-        return json.dumps(dict_representation, cls=DecimalEncoder)
+        return json.dumps(self.to_dict(amount_with_format))
 
     def convert(self, exchange_rate: str | float, currency: Currency) -> "Dinero":
         """
@@ -411,7 +405,7 @@ class Dinero(Operations):
         Raises:
             TypeError: If currency is not a Currency object.
             ValueError: If exchange_rate is negative, zero, or cannot be converted to
-                a number.
+                a number, or if the converted amount is too large.
 
         Examples:
             >>> from dinero.currencies import USD, EUR
@@ -433,5 +427,9 @@ class Dinero(Operations):
         return f"Dinero(amount={self.amount}, currency={self.currency})"
 
     def __str__(self):
-        formatted_output = self.format()
-        return f"{formatted_output}"
+        # the object is immutable, so the default format is computed only once
+        try:
+            return self._str_cache
+        except AttributeError:
+            self._str_cache = self.format()
+            return self._str_cache
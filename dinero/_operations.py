@@ -3,10 +3,12 @@ from typing import TYPE_CHECKING
 
 from ._base import Base
 from ._validators import Validators
-from .types import Currency, OperationType
+from .types import OperationType
 from .exceptions import InvalidOperationError
 
 if TYPE_CHECKING:
+    from typing_extensions import Self
+
     from ._dinero import Dinero
 
 
@@ -16,75 +18,65 @@ validate = Validators()
 class Operations(Base):
     """All the operations supported between Dinero objects."""
 
-    def __init__(self, amount: int | float | str | Decimal, currency: Currency):
-        from ._dinero import Dinero
-
-        super().__init__(amount, currency)
-        self.dinero = Dinero
+    __slots__ = ()
 
-    def __add__(self, addend: "OperationType | Dinero") -> "Dinero":
+    def __add__(self, addend: "OperationType | Dinero") -> "Self":
         validate.addition_and_subtraction_amount(addend)
-        addend_obj = self._get_instance(addend)
-        total = self._normalize() + addend_obj._normalize()
-        return self.dinero(total, self.currency)
+        total = self._normalize() + self._get_operand(addend)
+        return type(self)._from_decimal(total, self.currency)
 
     def __radd__(self, obj):
         return self
 
-    def __sub__(self, subtrahend: "OperationType | Dinero") -> "Dinero":
+    def __sub__(self, subtrahend: "OperationType | Dinero") -> "Self":
         validate.addition_and_subtraction_amount(subtrahend)
-        subtrahend_obj = self._get_instance(subtrahend)
-        total = self._normalize() - subtrahend_obj._normalize()
-        return self.dinero(total, self.currency)
+        total = self._normalize() - self._get_operand(subtrahend)
+        return type(self)._from_decimal(total, self.currency)
 
-    def __mul__(self, multiplicand: int | float | Decimal) -> "Dinero":
+    def __mul__(self, multiplicand: int | float | Decimal) -> "Self":
         validate.multiplication_and_division_amount(multiplicand)
-        multiplicand_obj = self._get_instance(multiplicand)
-        total = self._normalize() * multiplicand_obj._normalize()
-        return self.dinero(total, self.currency)
+        total = self._normalize() * self._get_operand(multiplicand)
+        return type(self)._from_decimal(total, self.currency)
 
-    def __truediv__(self, divisor: int | float | Decimal) -> "Dinero":
+    def __truediv__(self, divisor: int | float | Decimal) -> "Self":
         validate.multiplication_and_division_amount(divisor)
-        divisor_obj = self._get_instance(divisor)
-        total = self._normalize() / divisor_obj._normalize()
-        return self.dinero(total, self.currency)
+        total = self._normalize() / self._get_operand(divisor)
+        return type(self)._from_decimal(total, self.currency)
 
     def __eq__(self, amount: object) -> bool:
-        if not isinstance(amount, self.dinero):
+        if not isinstance(amount, Base):
             raise InvalidOperationError(InvalidOperationError.comparison_msg)
 
-        num_2 = self._get_instance(amount)._normalize(quantize=True)
-        num_1 = self._normalize(quantize=True)
-        return bool(num_1 == num_2)
+        self._check_same_currency(amount)
+        return self._minor == amount._minor
+
+    def __hash__(self) -> int:
+        return hash((self._code, self._minor))
 
     def __lt__(self, amount: object) -> bool:
-        if not isinstance(amount, self.dinero):
+        if not isinstance(amount, Base):
             raise InvalidOperationError(InvalidOperationError.comparison_msg)
 
-        num_1 = self._normalize(quantize=True)
-        num_2 = self._get_instance(amount)._normalize(quantize=True)
-        return bool(num_1 < num_2)
+        self._check_same_currency(amount)
+        return self._minor < amount._minor
 
     def __le__(self, amount: object) -> bool:
-        if not isinstance(amount, self.dinero):
+        if not isinstance(amount, Base):
             raise InvalidOperationError(InvalidOperationError.comparison_msg)
 
-        num_1 = self._normalize(quantize=True)
-        num_2 = self._get_instance(amount)._normalize(quantize=True)
-        return bool(num_1 <= num_2)
+        self._check_same_currency(amount)
+        return self._minor <= amount._minor
 
     def __gt__(self, amount: object) -> bool:
-        if not isinstance(amount, self.dinero):
+        if not isinstance(amount, Base):
             raise InvalidOperationError(InvalidOperationError.comparison_msg)
 
-        num_1 = self._normalize(quantize=True)
-        num_2 = self._get_instance(amount)._normalize(quantize=True)
-        return bool(num_1 > num_2)
+        self._check_same_currency(amount)
+        return self._minor > amount._minor
 
     def __ge__(self, amount: object) -> bool:
-        if not isinstance(amount, self.dinero):
+        if not isinstance(amount, Base):
             raise InvalidOperationError(InvalidOperationError.comparison_msg)
 
-        num_1 = self._normalize(quantize=True)
-        num_2 = self._get_instance(amount)._normalize(quantize=True)
-        return bool(num_1 >= num_2)
+        self._check_same_currency(amount)
+        return self._minor >= amount._minor
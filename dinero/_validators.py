@@ -46,21 +46,14 @@ class Validators:
     @staticmethod
     def dinero_amount(amount: int | float | str | Decimal) -> None:
         """
-        Validate that the amount passed to Dinero is of valid type
+        Validate that the amount passed to Dinero is of valid type. The value
+        itself is checked when it is converted to Decimal.
 
         Args:
-            amount (str, int, float, Decimal, Dinero)
+            amount (str, int, float, Decimal)
 
         Raises:
             InvalidOperationError: An operation between unsupported types was executed.
         """
-        from ._dinero import Dinero
-
-        try:
-            if not isinstance(amount, (int, float, str, Decimal, Dinero)):
-                raise InvalidOperationError(InvalidOperationError.operation_msg)
-
-            Decimal(amount)
-
-        except (ValueError, InvalidOperation):
+        if not isinstance(amount, (int, float, str, Decimal)):
             raise InvalidOperationError(InvalidOperationError.operation_msg)
@@ -30,6 +30,7 @@ Example:
 from decimal import Decimal, InvalidOperation
 
 from dinero import Dinero
+from dinero.exceptions import InvalidOperationError
 from dinero.types import Currency
 
 
@@ -47,7 +48,8 @@ def convert(dinero_obj: Dinero, exchange_rate: str | float, currency: Currency)
 
     Raises:
         TypeError: If dinero_obj is not a Dinero object or currency is not a Currency obj.
-        ValueError: If exchange_rate is negative, zero, or cannot be converted to an int.
+        ValueError: If exchange_rate is negative, zero, or cannot be converted to an int,
+            or if the converted amount is too large.
 
     Examples:
         >>> from dinero import Dinero
@@ -78,6 +80,9 @@ def convert(dinero_obj: Dinero, exchange_rate: str | float, currency: Currency)
     except (ValueError, InvalidOperation):
         raise ValueError("Exchange rate must be a valid number")
 
+    if not decimal_rate.is_finite():
+        raise ValueError("Exchange rate must be a valid number")
+
     # Ensure the exchange rate is positive
     if decimal_rate <= Decimal("0"):
         raise ValueError("Exchange rate must be a positive non-zero value")
@@ -86,5 +91,9 @@ def convert(dinero_obj: Dinero, exchange_rate: str | float, currency: Currency)
     source_amount = dinero_obj._normalize()
     target_amount = source_amount * decimal_rate
 
-    # Create a new Dinero object in the target currency
-    return Dinero(target_amount, currency)
+    # Create a new Dinero object in the target currency, the computed amount
+    # is already a valid Decimal so it skips the constructor validation
+    try:
+        return Dinero._from_decimal(target_amount, currency)
+    except InvalidOperationError:
+        raise ValueError("Exchange rate gives an amount too large to represent")
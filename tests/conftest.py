@@ -0,0 +1,14 @@
+import pytest
+
+from dinero import Dinero
+from dinero.currencies import USD
+
+
+@pytest.fixture(scope="session")
+def usd_amount():
+    return Dinero("24.5", USD)
+
+
+@pytest.fixture(params=[[], (), {}], ids=["list", "tuple", "dict"])
+def invalid_operand(request):
+    return request.param
@@ -79,6 +79,9 @@ class TestConversion:
             "0",  # Zero rate
             0,  # Zero rate as integer
             -0.5,  # Negative rate as float
+            "inf",  # Infinite rate
+            "NaN",  # Not a number
+            "1e400000",  # Converted amount too large
         ],
     )
     def test_convert_with_invalid_exchange_rate(self, invalid_rate):
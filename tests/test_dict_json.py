@@ -1,8 +1,16 @@
+import json
+
 import pytest
 
 from dinero import Dinero
 from dinero.currencies import USD
 
+USD_DICT = {"code": "USD", "base": 10, "exponent": 2, "symbol": "$"}
+UNFORMATTED_DICT = {"amount": "3333.26", "currency": USD_DICT}
+FORMATTED_DICT = {"amount": "3,333.26", "currency": USD_DICT}
+UNFORMATTED_JSON = '{"amount": "3333.20", "currency": {"code": "USD", "base": 10, "exponent": 2, "symbol": "$"}}'  # noqa: E501
+FORMATTED_JSON = '{"amount": "3,333.20", "currency": {"code": "USD", "base": 10, "exponent": 2, "symbol": "$"}}'  # noqa: E501
+
 
 @pytest.mark.parametrize(
     "amount",
@@ -13,11 +21,7 @@ from dinero.currencies import USD
     ids=["obj_str", "obj_int"],
 )
 def test_unformatted_dict(amount):
-    expected_unformatted_result = {
-        "amount": "3333.26",
-        "currency": {"code": "USD", "base": 10, "exponent": 2, "symbol": "$"},
-    }
-    assert amount.to_dict() == expected_unformatted_result
+    assert amount.to_dict() == UNFORMATTED_DICT
 
 
 @pytest.mark.parametrize(
@@ -29,11 +33,7 @@ def test_unformatted_dict(amount):
     ids=["obj_str", "obj_int"],
 )
 def test_formatted_dict(amount):
-    expected_result = {
-        "amount": "3,333.26",
-        "currency": {"code": "USD", "base": 10, "exponent": 2, "symbol": "$"},
-    }
-    assert amount.to_dict(amount_with_format=True) == expected_result
+    assert amount.to_dict(amount_with_format=True) == FORMATTED_DICT
 
 
 @pytest.mark.parametrize(
@@ -45,8 +45,8 @@ def test_formatted_dict(amount):
     ids=["obj_str", "obj_str"],
 )
 def test_unformatted_json(amount):
-    expected_result = '{"amount": "3333.20", "currency": {"code": "USD", "base": 10, "exponent": 2, "symbol": "$"}}'  # noqa: E501
-    assert amount.to_json() == expected_result
+    assert amount.to_json() == UNFORMATTED_JSON
+    assert json.loads(amount.to_json()) == amount.to_dict()
 
 
 @pytest.mark.parametrize(
@@ -58,5 +58,14 @@ def test_unformatted_json(amount):
     ids=["obj_str", "obj_str"],
 )
 def test_formatted_json(amount):
-    expected_result = '{"amount": "3,333.20", "currency": {"code": "USD", "base": 10, "exponent": 2, "symbol": "$"}}'  # noqa: E501
-    assert amount.to_json(amount_with_format=True) == expected_result
+    assert amount.to_json(amount_with_format=True) == FORMATTED_JSON
+    assert json.loads(amount.to_json(True)) == amount.to_dict(True)
+
+
+def test_to_dict_keeps_obj_intact():
+    amount = Dinero("3333.259", USD)
+    amount.to_dict()
+
+    assert amount.raw_amount == Dinero("3333.26", USD).raw_amount
+    assert amount + "1" == Dinero("3334.26", USD)
+    assert "symbol" not in USD
@@ -1,69 +1,89 @@
-from decimal import Decimal
+from decimal import Decimal, getcontext, localcontext
 
 import pytest
 
 from dinero import Dinero
 from dinero._validators import Validators
-from dinero.currencies import EUR, GBP, USD
+from dinero.currencies import BHD, EUR, GBP, JPY, USD
 from dinero.exceptions import InvalidOperationError
 
-unit_price = Dinero(2.32, USD)
-money_received = Dinero("6.96", USD)
-number_sold = 3
+validate = Validators()
 
+PLACES_BY_CCY = {"USD": Decimal("0.01"), "JPY": Decimal("1"), "BHD": Decimal("0.001")}
 
-validate = Validators()
 
+@pytest.fixture(scope="module")
+def dinero_cache():
+    return {}
 
-@pytest.mark.parametrize(
-    "amount",
-    [
-        (Dinero(24, USD)),
-        (Dinero(24.5, USD)),
-        (Dinero("24.5", USD)),
-    ],
-)
-def test_dinero_amount_validator(amount):
-    assert isinstance(amount, Dinero)
+
+@pytest.fixture
+def make(dinero_cache):
+    """Return a Dinero object, sharing instances built with the same arguments."""
+
+    def make(amount, currency):
+        key = (type(amount), str(amount), currency["code"])
+        if key not in dinero_cache:
+            dinero_cache[key] = Dinero(amount, currency)
+        return dinero_cache[key]
+
+    return make
+
+
+@pytest.mark.parametrize("amount", [24, 24.5, "24.5"])
+def test_dinero_amount_validator(make, amount):
+    assert isinstance(make(amount, USD), Dinero)
 
 
 @pytest.mark.parametrize(
     "amount",
-    [[], (), {}, set()],
+    [
+        [],
+        (),
+        {},
+        set(),
+        "abc",
+        "NaN",
+        float("inf"),
+        Dinero("1", USD),
+        "1e400000",
+        "1e999999999",
+        Decimal("-1e30"),
+    ],
 )
 def test_error_dinero_amount_validator(amount):
     with pytest.raises(InvalidOperationError):
         Dinero(amount, USD)
 
 
+@pytest.mark.parametrize("currency", [USD, JPY, BHD], ids=["USD", "JPY", "BHD"])
 @pytest.mark.parametrize(
     "obj, amount, raw_type",
     [
-        (Dinero(2.32, USD), Decimal(2.32), Decimal),
-        (Dinero("6.96", USD), Decimal(6.96), Decimal),
+        (2.32, Decimal(2.32), Decimal),
+        ("6.96", Decimal(6.96), Decimal),
     ],
 )
-def test_raw_amount(obj, amount, raw_type):
-    places = Decimal(f"1e-{USD['exponent']}")
+def test_raw_amount(make, currency, obj, amount, raw_type):
+    obj = make(obj, currency)
+    places = PLACES_BY_CCY[currency["code"]]
 
     assert obj.raw_amount == amount.quantize(places)
+    assert obj.raw_amount.as_tuple().exponent == places.as_tuple().exponent
     assert isinstance(obj.raw_amount, raw_type)
 
 
-usd_obj = Dinero(2.32, USD)
-eur_obj = Dinero(2.32, EUR)
-gbp_obj = Dinero(2.32, GBP)
-
-
 @pytest.mark.parametrize(
-    "obj, symbol, code, exponent, precision",
+    "currency, symbol, code, exponent, precision",
     [
-        (usd_obj, "$", "USD", 2, 10),
-        (eur_obj, "€", "EUR", 2, 10),
-        (gbp_obj, "£", "GBP", 2, 10),
+        (USD, "$", "USD", 2, 10),
+        (EUR, "€", "EUR", 2, 10),
+        (GBP, "£", "GBP", 2, 10),
     ],
 )
-def test_obj_properties(obj, symbol, code, exponent, precision):
+def test_obj_properties(make, currency, symbol, code, exponent, precision):
+    obj = make(2.32, currency)
+
     assert obj.symbol == symbol
     assert obj.code == code
     assert obj.exponent == exponent
@@ -71,30 +91,36 @@ def test_obj_properties(obj, symbol, code, exponent, precision):
 
 
 @pytest.mark.parametrize(
-    "obj, number, symbol, currency, full",
+    "obj_currency, number, symbol, currency, full",
     [
-        (usd_obj, "2.32", "$2.32", "2.32 USD", "$2.32 USD"),
-        (eur_obj, "2.32", "€2.32", "2.32 EUR", "€2.32 EUR"),
-        (gbp_obj, "2.32", "£2.32", "2.32 GBP", "£2.32 GBP"),
+        (USD, "2.32", "$2.32", "2.32 USD", "$2.32 USD"),
+        (EUR, "2.32", "€2.32", "2.32 EUR", "€2.32 EUR"),
+        (GBP, "2.32", "£2.32", "2.32 GBP", "£2.32 GBP"),
     ],
 )
-def test_obj_formatted(obj, number, symbol, currency, full):
+def test_obj_formatted(make, obj_currency, number, symbol, currency, full):
+    obj = make(2.32, obj_currency)
+
     assert obj.format() == number
     assert obj.format(symbol=True) == symbol
     assert obj.format(currency=True) == currency
     assert obj.format(symbol=True, currency=True) == full
+    assert str(obj) == number
+    assert str(obj) is str(obj)
 
 
 @pytest.mark.parametrize(
     "unit_price, units_sold, money_received",
     [
-        (Dinero("2.32", USD), 3, Dinero("6.96", USD)),
-        (Dinero("2.32", USD), Decimal(3), Dinero("6.96", USD)),
-        (Dinero("2.32", USD), 3.0, Dinero("6.96", USD)),
-        (Dinero("2.32", USD), Decimal(3.0), Dinero("6.96", USD)),
+        ("2.32", 3, "6.96"),
+        ("2.32", Decimal(3), "6.96"),
+        ("2.32", 3.0, "6.96"),
+        ("2.32", Decimal(3.0), "6.96"),
     ],
 )
-def test_balance_ok(unit_price, units_sold, money_received):
+def test_balance_ok(make, unit_price, units_sold, money_received):
+    unit_price, money_received = make(unit_price, USD), make(money_received, USD)
+
     assert unit_price.multiply(units_sold).eq(money_received)
     assert unit_price * units_sold == money_received
 
@@ -102,12 +128,116 @@ def test_balance_ok(unit_price, units_sold, money_received):
 @pytest.mark.parametrize(
     "unit_price, units_sold, money_received",
     [
-        (Dinero("2.38", USD), 3, Dinero("6.96", USD)),
-        (Dinero("2.38", USD), Decimal(3), Dinero("6.96", USD)),
-        (Dinero("2.32", USD), 2.33, Dinero("5.38", USD)),
-        (Dinero("2.32", USD), Decimal(2.33), Dinero("5.38", USD)),
+        ("2.38", 3, "6.96"),
+        ("2.38", Decimal(3), "6.96"),
+        ("2.32", 2.33, "5.38"),
+        ("2.32", Decimal(2.33), "5.38"),
     ],
 )
-def test_balance_wrong(unit_price, units_sold, money_received):
+def test_balance_wrong(make, unit_price, units_sold, money_received):
+    unit_price, money_received = make(unit_price, USD), make(money_received, USD)
+
     assert unit_price.multiply(units_sold).eq(money_received) is False
     assert unit_price * units_sold != money_received
+
+
+def test_large_amount():
+    amount = Dinero("123456789.123", USD)
+
+    assert amount.format() == "123,456,789.12"
+    assert amount * 2 == Dinero("246913578.25", USD)
+
+
+@pytest.mark.parametrize("prec", [None, 10])
+def test_context_untouched(prec):
+    # custom precisions are set in a local context so they never leak
+    with localcontext() as ctx:
+        ctx.prec = prec or ctx.prec
+        expected_prec = getcontext().prec
+        amount = Dinero("2.32", USD) / 3
+
+        assert amount.format() == "0.77"
+        assert amount == Dinero("0.77", USD)
+        assert getcontext().prec == expected_prec
+
+
+def test_scaling_ignores_context_precision():
+    with localcontext() as ctx:
+        ctx.prec = 6
+        amount = Dinero("123456.78", USD)
+
+        assert amount.format() == "123,456.78"
+        assert amount.raw_amount == Decimal("123456.78")
+
+
+def test_amount_limit_ignores_context_precision():
+    with localcontext() as ctx:
+        ctx.prec = 6
+        amount = Dinero("1234567", USD)
+        total = amount + "1234567"
+
+        assert amount == Dinero(1234567, USD)
+        assert isinstance(total, Dinero)
+
+
+def test_large_int_amount_is_exact():
+    amount = Dinero(10**27 + 1, USD)
+
+    assert amount.raw_amount == Decimal(10**27 + 1)
+    assert amount != Dinero(10**27, USD)
+    assert amount + 0 == amount
+    assert amount * 1 == amount
+
+
+@pytest.mark.parametrize("amount", [10**28, -(10**28), 10**40 + 1])
+def test_int_amount_over_limit(amount):
+    with pytest.raises(InvalidOperationError):
+        Dinero(amount, USD)
+
+
+def test_amount_and_currency_are_read_only():
+    amount = Dinero("2.32", USD)
+
+    with pytest.raises(AttributeError):
+        amount.amount = Decimal("3")  # type: ignore
+
+    with pytest.raises(AttributeError):
+        amount.currency = JPY  # type: ignore
+
+    assert amount == Dinero("2.32", USD)
+    assert amount.to_dict()["currency"]["code"] == "USD"
+
+
+def test_no_instance_dict():
+    amount = Dinero("2.32", USD)
+
+    assert not hasattr(amount, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "amount, expected",
+    [
+        ("0.125", "0.12"),
+        ("0.135", "0.14"),
+        ("-0.125", "-0.12"),
+    ],
+)
+def test_half_even_rounding(amount, expected):
+    assert Dinero(amount, USD).format() == expected
+    assert Dinero(amount, USD) == Dinero(expected, USD)
+
+
+@pytest.mark.parametrize(
+    "amount, currency, raw_amount",
+    [
+        (24, USD, Decimal("24.00")),
+        (-3, USD, Decimal("-3.00")),
+        (1500, JPY, Decimal("1500")),
+    ],
+)
+def test_int_amount(amount, currency, raw_amount):
+    obj = Dinero(amount, currency)
+
+    assert obj.raw_amount == raw_amount
+    assert str(obj.raw_amount) == str(raw_amount)
+    assert obj == Dinero(str(amount), currency)
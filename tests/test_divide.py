@@ -17,22 +17,18 @@ from dinero.exceptions import InvalidOperationError
     ],
 )
 def test_divide_amount(amount, divisor, total):
+    result = amount.divide(divisor)
+
+    assert result == total
+    assert result.eq(total)
     assert amount / divisor == total
-    assert amount.divide(divisor) == total
-    assert amount.divide(divisor).eq(total)
 
 
-@pytest.mark.parametrize(
-    "amount, addend",
-    [
-        (Dinero(24.5, USD), []),
-        (Dinero(24.5, USD), ()),
-        (Dinero("24.5", USD), {}),
-    ],
-)
-def test_invalid_operation_error(amount, addend):
+def test_divide_result_too_large():
+    amount = Dinero("1", USD)
+
     with pytest.raises(InvalidOperationError):
-        amount / addend  # type: ignore
+        amount / Decimal("1e-400000")
 
     with pytest.raises(InvalidOperationError):
-        amount.divide(addend)
+        amount.divide("1e-400000")
@@ -4,7 +4,6 @@ import pytest
 
 from dinero import Dinero
 from dinero.currencies import USD
-from dinero.exceptions import InvalidOperationError
 
 
 @pytest.mark.parametrize(
@@ -17,22 +16,8 @@ from dinero.exceptions import InvalidOperationError
     ],
 )
 def test_multiply_amount_str(amount, multiplicand, total):
-    assert amount * multiplicand == total
-    assert amount.multiply(multiplicand) == total
-    assert amount.multiply(multiplicand).eq(total)
-
-
-@pytest.mark.parametrize(
-    "amount, addend",
-    [
-        (Dinero(24.5, USD), []),
-        (Dinero(24.5, USD), ()),
-        (Dinero("24.5", USD), {}),
-    ],
-)
-def test_invalid_operation_error(amount, addend):
-    with pytest.raises(InvalidOperationError):
-        amount * addend  # type: ignore
+    result = amount.multiply(multiplicand)
 
-    with pytest.raises(InvalidOperationError):
-        amount.multiply(addend)
+    assert result == total
+    assert result.eq(total)
+    assert amount * multiplicand == total
@@ -1,3 +1,5 @@
+import operator
+
 import pytest
 
 from dinero import Dinero
@@ -17,6 +19,19 @@ def test_equal(obj_1, obj_2):
     assert obj_1.eq(obj_2)
 
 
+@pytest.mark.parametrize(
+    "obj_1, obj_2",
+    [
+        (Dinero(24.5, USD), Dinero("24.50", USD)),
+        (Dinero(22.9934534, USD), Dinero("22.99", USD)),
+    ],
+)
+def test_hash(obj_1, obj_2):
+    assert hash(obj_1) == hash(obj_2)
+    assert len({obj_1, obj_2}) == 1
+    assert {obj_1: "value"}[obj_2] == "value"
+
+
 @pytest.mark.parametrize(
     "obj_1, obj_2",
     [
@@ -79,15 +94,9 @@ def test_gte(obj_1, obj_2):
     assert obj_1.gte(obj_2)
 
 
-@pytest.mark.parametrize(
-    "amount, addend",
-    [
-        (Dinero(24.5, USD), []),
-        (Dinero(24.5, USD), ()),
-        (Dinero("24.5", USD), {}),
-    ],
-)
-def test_invalid_operation_error(amount, addend):
+def test_invalid_operation_error(usd_amount, invalid_operand):
+    amount, addend = usd_amount, invalid_operand
+
     with pytest.raises(InvalidOperationError):
         amount == addend  # type: ignore
 
@@ -117,3 +126,21 @@ def test_invalid_operation_error(amount, addend):
 
     with pytest.raises(InvalidOperationError):
         amount.gte(addend)
+
+
+@pytest.mark.parametrize(
+    "operation, method",
+    [
+        (operator.add, "add"),
+        (operator.sub, "subtract"),
+        (operator.mul, "multiply"),
+        (operator.truediv, "divide"),
+    ],
+    ids=["add", "subtract", "multiply", "divide"],
+)
+def test_invalid_arithmetic_operand(usd_amount, invalid_operand, operation, method):
+    with pytest.raises(InvalidOperationError):
+        operation(usd_amount, invalid_operand)
+
+    with pytest.raises(InvalidOperationError):
+        getattr(usd_amount, method)(invalid_operand)
@@ -1,90 +1,76 @@
+import itertools
+
 import pytest
 
 from dinero import Dinero
 from dinero.currencies import EUR, USD
-from dinero.exceptions import DifferentCurrencyError, InvalidOperationError
-
+from dinero.exceptions import DifferentCurrencyError
 
-@pytest.mark.parametrize(
-    "amount, subtrahend, total",
-    [
-        (Dinero("24.5", USD), Dinero("1", USD), Dinero("23.50", USD)),
-        (Dinero("24.5", USD), "1", Dinero("23.50", USD)),
-    ],
-    ids=["obj_obj_obj", "obj_str_obj"],
+# the subtrahend is used as a Dinero object or as the raw amount
+subtrahend_types = pytest.mark.parametrize(
+    "subtrahend_obj", [True, False], ids=["obj", "raw"]
 )
-def test_subtract_amount_str(amount, subtrahend, total):
+
+# every str/number combination except the all-str and all-number ones
+MIXED = [
+    case
+    for case in itertools.product(["24.5", 24.5], ["1", 1], ["23.50", 23.50])
+    if len({isinstance(value, str) for value in case}) > 1
+]
+
+
+def build(amount, subtrahend, total, subtrahend_obj):
+    subtrahend = Dinero(subtrahend, USD) if subtrahend_obj else subtrahend
+    return Dinero(amount, USD), subtrahend, Dinero(total, USD)
+
+
+@subtrahend_types
+@pytest.mark.parametrize("amount, subtrahend, total", [("24.5", "1", "23.50")])
+def test_subtract_amount_str(amount, subtrahend, total, subtrahend_obj):
+    amount, subtrahend, total = build(amount, subtrahend, total, subtrahend_obj)
+    result = amount.subtract(subtrahend)
+
+    assert result == total
+    assert result.eq(total)
     assert amount - subtrahend == total
-    assert amount.subtract(subtrahend) == total
-    assert amount.subtract(subtrahend).eq(total)
 
 
-@pytest.mark.parametrize(
-    "amount, subtrahend, total",
-    [
-        (Dinero(24.5, USD), Dinero(1, USD), Dinero(23.50, USD)),
-        (Dinero(24.5, USD), 1, Dinero(23.50, USD)),
-    ],
-    ids=["obj_obj_obj", "obj_str_obj"],
-)
-def test_subtract_amount_number(amount, subtrahend, total):
+@subtrahend_types
+@pytest.mark.parametrize("amount, subtrahend, total", [(24.5, 1, 23.50)])
+def test_subtract_amount_number(amount, subtrahend, total, subtrahend_obj):
+    amount, subtrahend, total = build(amount, subtrahend, total, subtrahend_obj)
+    result = amount.subtract(subtrahend)
+
+    assert result == total
+    assert result.eq(total)
     assert amount - subtrahend == total
-    assert amount.subtract(subtrahend) == total
-    assert amount.subtract(subtrahend).eq(total)
 
 
-@pytest.mark.parametrize(
-    "amount, subtrahend, total",
-    [
-        (Dinero(24.5, USD), Dinero("1", USD), Dinero("23.50", USD)),
-        (Dinero("24.5", USD), Dinero(1, USD), Dinero("23.50", USD)),
-        (Dinero("24.5", USD), Dinero("1", USD), Dinero(23.50, USD)),
-        (Dinero(24.5, USD), Dinero(1, USD), Dinero("23.50", USD)),
-        (Dinero("24.5", USD), Dinero(1, USD), Dinero(23.50, USD)),
-        (Dinero(24.5, USD), Dinero("1", USD), Dinero(23.50, USD)),
-        # ----
-        (Dinero(24.5, USD), "1", Dinero("23.50", USD)),
-        (Dinero("24.5", USD), 1, Dinero("23.50", USD)),
-        (Dinero("24.5", USD), "1", Dinero(23.50, USD)),
-        (Dinero(24.5, USD), 1, Dinero("23.50", USD)),
-        (Dinero("24.5", USD), 1, Dinero(23.50, USD)),
-        (Dinero(24.5, USD), "1", Dinero(23.50, USD)),
-    ],
-)
-def test_subtract_amount_mixed(amount, subtrahend, total):
+@subtrahend_types
+@pytest.mark.parametrize("amount, subtrahend, total", MIXED)
+def test_subtract_amount_mixed(amount, subtrahend, total, subtrahend_obj):
+    amount, subtrahend, total = build(amount, subtrahend, total, subtrahend_obj)
+    result = amount.subtract(subtrahend)
+
+    assert result == total
+    assert result.eq(total)
     assert amount - subtrahend == total
-    assert amount.subtract(subtrahend) == total
-    assert amount.subtract(subtrahend).eq(total)
 
 
 @pytest.mark.parametrize(
     "amount, subtrahend",
     [
-        (Dinero(24.5, USD), Dinero(1, EUR)),
-        (Dinero(24.5, USD), Dinero("1", EUR)),
-        (Dinero("24.5", USD), Dinero("1", EUR)),
-        (Dinero("24.5", USD), Dinero(1, EUR)),
+        (24.5, 1),
+        (24.5, "1"),
+        ("24.5", "1"),
+        ("24.5", 1),
     ],
 )
 def test_different_currencies_error(amount, subtrahend):
+    amount, subtrahend = Dinero(amount, USD), Dinero(subtrahend, EUR)
+
     with pytest.raises(DifferentCurrencyError):
         amount - subtrahend  # type: ignore
 
     with pytest.raises(DifferentCurrencyError):
         amount.subtract(subtrahend)
-
-
-@pytest.mark.parametrize(
-    "amount, addend",
-    [
-        (Dinero(24.5, USD), []),
-        (Dinero(24.5, USD), ()),
-        (Dinero("24.5", USD), {}),
-    ],
-)
-def test_invalid_operation_error(amount, addend):
-    with pytest.raises(InvalidOperationError):
-        amount - addend  # type: ignore
-
-    with pytest.raises(InvalidOperationError):
-        amount.subtract(addend)